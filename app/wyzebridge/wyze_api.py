@@ -414,7 +414,7 @@ class WyzeApi:
         )
         requests.post(
             f"http://localhost:8080/websocket/{uri}",
-            json=kvs_stream.params.model_dump(),
+            data=kvs_stream.params.model_dump_json().encode(),
             headers={"Content-Type": "application/json"},
         )
         sleep(1)
@@ -297,7 +297,7 @@ def get_camera_stream(auth_info: WyzeCredential, camera: WyzeCamera) -> Stream:
     payload = sort_dict(payload)
     headers = sign_payload(auth_info, "9319141212m2ik", payload)
     resp = post(url, data=payload, headers=headers)
-    return Stream(**validate_resp(resp)[0])
+    return Stream.model_validate(validate_resp(resp)[0])
 
 
 def get_cam_webrtc(auth_info: WyzeCredential, mac_id: str) -> dict:
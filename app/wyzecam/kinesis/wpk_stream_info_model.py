@@ -1,8 +1,10 @@
 from typing import Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class IceServer(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     url: str
     username: str = ""
     credential: str = ""
@@ -15,6 +17,8 @@ class ParamsBean(BaseModel):
 
 
 class PropertyBean(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
     property_data: Dict[str, int] = Field(default_factory=dict, alias="property")
 
 
@@ -26,11 +30,10 @@ class Stream(BaseModel):
 
 
 class WpkStreamInfo(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
     code: str
     ts: int
     msg: str
     data: List[Stream]
     traceId: Optional[str] = None
-
-    class Config:
-        allow_population_by_field_name = True
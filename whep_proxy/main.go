@@ -3,8 +3,10 @@ package main
 import (
 	"encoding/base64"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"io"
+	"net"
 	"net/http"
 	"net/url"
 	"os"
@@ -36,6 +38,10 @@ type WebRTCConfig struct {
 	ICEServers   []ICEServer `json:"ice_servers"`
 }
 
+// Signaling frames are small JSON envelopes; cap the size of a single inbound
+// message so a runaway frame can't grow memory without bound.
+const signalingReadLimit = 1 << 16
+
 var streams = make(map[string]*WebRTCStream)
 var streamsMu sync.Mutex
 
@@ -95,6 +101,17 @@ func cleanupStream(streamID string, stream *WebRTCStream) {
 	fmt.Printf("[WHEP_PROXY] Stream %s cleaned up\n", streamID)
 }
 
+// isFatalReadError reports whether a ReadJSON error means the signaling
+// connection itself is gone, as opposed to a single undecodable frame.
+func isFatalReadError(err error) bool {
+	var closeErr *websocket.CloseError
+	var netErr net.Error
+	return errors.As(err, &closeErr) ||
+		errors.Is(err, websocket.ErrReadLimit) ||
+		errors.As(err, &netErr) ||
+		errors.Is(err, io.EOF)
+}
+
 func websocketHandler(w http.ResponseWriter, r *http.Request) {
 	vars := mux.Vars(r)
 	streamID := vars["streamID"]
@@ -144,6 +161,7 @@ func websocketHandler(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 	fmt.Println("[WHEP_PROXY] Successfully connected to WebSocket") // Log successful connection
+	conn.SetReadLimit(signalingReadLimit)
 
 	streamsMu.Lock()
 	defer streamsMu.Unlock()
@@ -331,7 +349,21 @@ func websocketHandler(w http.ResponseWriter, r *http.Request) {
 						fmt.Printf("[WHEP_PROXY] error: %v", err)
 					}
 					fmt.Println("[WHEP_PROXY] Error reading JSON:", err)
-					continue
+					if !isFatalReadError(err) {
+						continue
+					}
+					// The connection is unusable and gorilla panics on repeated reads from it.
+					// Keep a connected peer so media keeps flowing; otherwise drop the stream
+					// so the next websocket POST renegotiates from scratch.
+					streamsMu.Lock()
+					if streams[streamID] == stream && stream.wsConn == conn &&
+						stream.peerConnection.ConnectionState() != webrtc.PeerConnectionStateConnected {
+						cleanupStream(streamID, stream)
+					} else {
+						conn.Close()
+					}
+					streamsMu.Unlock()
+					return
 				}
 
 				msgType, ok := msg["messageType"].(string)